@@ -13,11 +13,12 @@ Features:
 """
 
 import locale
-import sqlite3
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
+import polars as pl
 import streamlit as st
 from streamlit_card import card
 
@@ -25,12 +26,15 @@ from streamlit_card import card
 locale.setlocale(locale.LC_ALL, "pt_BR.UTF-8")
 
 # Constants
-DATABASE_PATH = Path("../../data/data.db")
-QUERY = "SELECT * FROM mercadolivre"
+DATA_PATH = Path("../../data/data.parquet")
+COLUMNS = ("brand", "new_price", "review_rating_number")
 DASHBOARD_TITLE = "Pesquisa de Mercado - Geladeiras Frost-Free"
 THEME_COLOR = "#3498db"  # Primary theme color
 SECONDARY_COLOR = "#2ecc71"  # Secondary theme color for accents
 
+# Sidebar filter state: (selected brands, price range, minimum rating)
+Filters = tuple[tuple[str, ...], tuple[float, float], float]
+
 # Custom CSS for styling
 CUSTOM_CSS = """
 <style>
@@ -68,49 +72,162 @@ CUSTOM_CSS = """
         font-weight: bold;
         color: #3498db;
     }
-
-    .chart-container {
-        background-color: white;
-        border-radius: 10px;
-        padding: 15px;
-        box-shadow: 0 2px 5px rgba(0, 0, 0, 0.1);
-    }
-
-    .data-table {
-        background-color: white;
-        border-radius: 10px;
-        padding: 10px;
-        box-shadow: 0 2px 5px rgba(0, 0, 0, 0.1);
-    }
 </style>
 """
 
 
-def load_data(database_path: Path, query: str) -> pd.DataFrame:
+def data_version(data_path: Path) -> float:
     """
-    Load data from SQLite database into a pandas DataFrame.
+    Return the modification time of the data file.
+
+    Passed to the cached functions below so their results are invalidated as soon
+    as the transform step rewrites the file.
 
     Args:
-        database_path: Path to the SQLite database file
-        query: SQL query to execute
+        data_path: Path to the data file
 
     Returns:
-        pandas DataFrame containing the query results
+        File modification timestamp
+
+    Raises:
+        OSError: If the data file does not exist
     """
-    try:
-        conn = sqlite3.connect(database_path)
-        df = pd.read_sql_query(query, conn)
+    return data_path.stat().st_mtime
 
-        # Clean and prepare data
-        df["brand"] = df["brand"].str.title()  # Capitalize brand names properly
 
-        return df
-    except sqlite3.Error as e:
-        st.error(f"Erro ao acessar o banco de dados: {e}")
-        return pd.DataFrame()
-    finally:
-        if "conn" in locals():
-            conn.close()
+@st.cache_data(show_spinner=False, ttl=3600)
+def load_data(data_path: str, columns: tuple[str, ...], version: float) -> pd.DataFrame:
+    """
+    Load data from the Parquet export into a pandas DataFrame.
+
+    The result is cached by Streamlit, so the file is only read once per hour
+    instead of on every rerun triggered by a widget interaction. Errors are raised
+    rather than returned, so a failed read is never cached.
+
+    Args:
+        data_path: Path to the Parquet file written by the transform step
+        columns: Columns to read from the file
+        version: Data file version from ``data_version``, part of the cache key
+
+    Returns:
+        pandas DataFrame containing the requested columns
+
+    Raises:
+        OSError: If the data file cannot be read
+    """
+    # Only the columns used by the dashboard are read from disk; the title-cased
+    # categorical brand column and float32 prices from the transform step are preserved
+    df = pd.read_parquet(data_path, columns=list(columns))
+
+    return df
+
+
+def filter_data(
+    df: pd.DataFrame,
+    selected_brands: tuple[str, ...],
+    price_range: tuple[float, float],
+    min_rating: float,
+) -> pd.DataFrame:
+    """
+    Apply the sidebar filters to the dataset.
+
+    Not cached: building the mask is cheap, while a cached result would be pickled
+    and unpickled as a full copy of the filtered frame on every rerun.
+
+    Args:
+        df: DataFrame containing the market research data
+        selected_brands: Brands to keep (all brands when empty)
+        price_range: Inclusive (min, max) price range
+        min_rating: Minimum review rating
+
+    Returns:
+        Filtered DataFrame
+    """
+    # Apply filters with a single combined mask (no intermediate DataFrames)
+    new_price = df["new_price"].to_numpy(dtype="float64", na_value=np.nan)
+    rating = df["review_rating_number"].to_numpy(dtype="float64", na_value=np.nan)
+
+    mask = np.ones(len(df), dtype=bool)
+    if selected_brands:
+        mask &= df["brand"].isin(selected_brands).to_numpy()
+    mask &= (new_price >= price_range[0]) & (new_price <= price_range[1]) & (rating >= min_rating)
+
+    return df.iloc[mask]
+
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=8)
+def price_bounds(version: float) -> tuple[float, float]:
+    """
+    Compute the price slider bounds from the cached dataset.
+
+    Args:
+        version: Data file version from ``data_version``
+
+    Returns:
+        Tuple of (min, max) price
+    """
+    df = load_data(str(DATA_PATH), COLUMNS, version)
+
+    price_arr = df["new_price"].to_numpy(dtype="float64", na_value=np.nan)
+    return float(np.nanmin(price_arr)), float(np.nanmax(price_arr))
+
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=64)
+def brand_aggregations(
+    version: float,
+    selected_brands: tuple[str, ...],
+    price_range: tuple[float, float],
+    min_rating: float,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Compute the per-brand aggregations shown in the dashboard for the given filters.
+
+    The three queries are built lazily and collected together, so Polars scans the
+    filtered data once and runs the group-bys in parallel.
+
+    Args:
+        version: Data file version from ``data_version``
+        selected_brands: Brands to keep (all brands when empty)
+        price_range: Inclusive (min, max) price range
+        min_rating: Minimum review rating
+
+    Returns:
+        Tuple of (top brands, average prices, average satisfaction) DataFrames, each
+        holding at most 10 brands sorted ascending by their value column
+    """
+    df = load_data(str(DATA_PATH), COLUMNS, version)
+    lf = pl.from_pandas(filter_data(df, selected_brands, price_range, min_rating)).lazy()
+
+    # Group-by output order is not deterministic, so brand is a secondary sort key
+    # to keep ties in a stable, alphabetical order
+    lf = lf.with_columns(pl.col("brand").cast(pl.String))
+
+    top_brands = (
+        lf.group_by("brand")
+        .len()
+        .sort(["len", "brand"], descending=[True, False])
+        .head(10)
+        .sort(["len", "brand"], descending=[False, True])
+        .rename({"brand": "Marca", "len": "Quantidade"})
+    )
+    avg_prices = (
+        lf.group_by("brand")
+        .agg(pl.col("new_price").cast(pl.Float64).mean())
+        .sort(["new_price", "brand"], descending=[False, True])
+        .tail(10)
+        .rename({"brand": "Marca", "new_price": "Preço Médio"})
+    )
+    satisfaction = (
+        lf.group_by("brand")
+        .agg(pl.col("review_rating_number").cast(pl.Float64).mean())
+        .sort(["review_rating_number", "brand"], descending=[False, True])
+        .tail(10)
+        .rename({"brand": "Marca", "review_rating_number": "Avaliação Média"})
+    )
+
+    return tuple(
+        frame.to_pandas() for frame in pl.collect_all([top_brands, avg_prices, satisfaction])
+    )
 
 
 def format_currency(value) -> str:
@@ -139,13 +256,21 @@ def display_kpi_metrics(df: pd.DataFrame) -> None:
     """
     st.markdown('<div class="subheader">KPIs Principais do Sistema</div>', unsafe_allow_html=True)
 
+    # Pull the raw arrays once and compute the KPIs with NumPy; brands are counted
+    # from the categorical integer codes (-1 marks a missing brand)
+    brand_codes = df["brand"].cat.codes.to_numpy()
+    price_arr = df["new_price"].to_numpy(dtype="float64", na_value=np.nan)
+    n_items = price_arr.shape[0]
+    n_brands = np.unique(brand_codes[brand_codes >= 0]).size
+    avg_price = np.nanmean(price_arr) if n_items else np.nan
+
     col1, col2, col3 = st.columns(3)
 
     # Total items KPI with icon
     with col1:
         card(
             title="Total de Itens",
-            text=f"{df.shape[0]}",
+            text=f"{n_items}",
             image="https://cdn-icons-png.flaticon.com/512/3500/3500833.png",
             key="items_card",
         )
@@ -154,13 +279,12 @@ def display_kpi_metrics(df: pd.DataFrame) -> None:
     with col2:
         card(
             title="Total de Marcas",
-            text=f"{df['brand'].nunique()}",
+            text=f"{n_brands}",
             image="https://cdn-icons-png.flaticon.com/512/1170/1170678.png",
             key="brands_card",
         )
 
     # Average price KPI with formatted currency and icon
-    avg_price = df["new_price"].mean()
     with col3:
         card(
             title="Preço Médio",
@@ -170,113 +294,139 @@ def display_kpi_metrics(df: pd.DataFrame) -> None:
         )
 
 
-def display_top_brands(df: pd.DataFrame) -> None:
+@st.cache_resource(max_entries=16)
+def top_brands_figure(labels: tuple[str, ...], values: tuple[int, ...]) -> go.Figure:
+    """
+    Build the bar chart of brands by product count.
+
+    The figure is built directly from graph objects and cached on the plotted values,
+    so reruns with unchanged filters reuse it.
+
+    Args:
+        labels: Brand names, in plotting order
+        values: Product count for each brand
+
+    Returns:
+        Plotly figure
+    """
+    fig = go.Figure(
+        go.Bar(
+            x=values,
+            y=labels,
+            orientation="h",
+            marker=dict(
+                color=values,
+                colorscale=[[0, "#BDE0FE"], [0.5, "#3498db"], [1, "#1A5276"]],
+            ),
+        )
+    )
+    fig.update_layout(
+        title="Top 10 Marcas por Quantidade de Produtos",
+        height=400,
+        xaxis_title="Quantidade de Produtos",
+        yaxis_title="",
+        hoverlabel=dict(bgcolor="white", font_size=12),
+        margin=dict(l=0, r=0, t=40, b=0),
+    )
+    fig.update_traces(
+        texttemplate="%{x}",
+        textposition="outside",
+        hovertemplate="<b>%{y}</b><br>Quantidade: %{x}<extra></extra>",
+    )
+
+    return fig
+
+
+def display_top_brands(top_brands_data: pd.DataFrame) -> None:
     """
     Display top 10 brands distribution with interactive bar chart and data table.
 
     Args:
-        df: DataFrame containing the market research data
+        top_brands_data: Top brands by product count, sorted ascending
     """
     st.markdown('<div class="subheader">Marcas mais Encontradas</div>', unsafe_allow_html=True)
 
     # Create column layout with larger space for chart
     col1, col2 = st.columns([3, 1])
 
-    # Get top 10 brands by count, sorted in descending order
-    top_brands_data = df["brand"].value_counts().reset_index()
-    top_brands_data.columns = ["Marca", "Quantidade"]
-    top_brands_data = top_brands_data.head(10).sort_values("Quantidade", ascending=True)
-
     # Create interactive bar chart with Plotly
-    with col1:
-        st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-        fig = px.bar(
-            top_brands_data,
-            y="Marca",
-            x="Quantidade",
-            orientation="h",
-            color="Quantidade",
-            color_continuous_scale=["#BDE0FE", "#3498db", "#1A5276"],
-            title="Top 10 Marcas por Quantidade de Produtos",
-            text="Quantidade",
+    with col1, st.container(border=True):
+        fig = top_brands_figure(
+            tuple(top_brands_data["Marca"].tolist()), tuple(top_brands_data["Quantidade"].tolist())
         )
-        fig.update_layout(
-            height=400,
-            xaxis_title="Quantidade de Produtos",
-            yaxis_title="",
-            coloraxis_showscale=False,
-            hoverlabel=dict(bgcolor="white", font_size=12),
-            margin=dict(l=0, r=0, t=40, b=0),
-        )
-        fig.update_traces(
-            texttemplate="%{x}",
-            textposition="outside",
-            hovertemplate="<b>%{y}</b><br>Quantidade: %{x}<extra></extra>",
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.plotly_chart(fig, use_container_width=True, key="top_brands_chart")
 
     # Display data table with styling
-    with col2:
-        st.markdown('<div class="data-table">', unsafe_allow_html=True)
+    with col2, st.container(border=True):
         st.dataframe(
             top_brands_data.sort_values("Quantidade", ascending=False),
             column_config={"Quantidade": st.column_config.NumberColumn(format="%d")},
             hide_index=True,
             use_container_width=True,
         )
-        st.markdown("</div>", unsafe_allow_html=True)
 
 
-def display_average_prices(df: pd.DataFrame) -> None:
+@st.cache_resource(max_entries=16)
+def average_prices_figure(labels: tuple[str, ...], values: tuple[float, ...]) -> go.Figure:
+    """
+    Build the bar chart of brands by average price.
+
+    Args:
+        labels: Brand names, in plotting order
+        values: Average price for each brand
+
+    Returns:
+        Plotly figure
+    """
+    fig = go.Figure(
+        go.Bar(
+            x=values,
+            y=labels,
+            orientation="h",
+            marker=dict(
+                color=values,
+                colorscale=[[0, "#ABEBC6"], [0.5, "#2ecc71"], [1, "#196F3D"]],
+            ),
+        )
+    )
+    fig.update_layout(
+        title="Top 10 Marcas por Preço Médio",
+        height=400,
+        xaxis_title="Preço Médio (R$)",
+        yaxis_title="",
+        hoverlabel=dict(bgcolor="white", font_size=12),
+        margin=dict(l=0, r=0, t=40, b=0),
+    )
+    fig.update_traces(
+        texttemplate="R$ %{x:.2f}",
+        textposition="outside",
+        hovertemplate="<b>%{y}</b><br>Preço Médio: R$ %{x:.2f}<extra></extra>",
+    )
+
+    return fig
+
+
+def display_average_prices(avg_prices: pd.DataFrame) -> None:
     """
     Display average prices by brand with interactive bar chart and data table.
 
     Args:
-        df: DataFrame containing the market research data
+        avg_prices: Top brands by average price, sorted ascending
     """
     st.markdown('<div class="subheader">Preços Médios por Marca</div>', unsafe_allow_html=True)
 
     # Create column layout with larger space for chart
     col1, col2 = st.columns([3, 1])
 
-    # Calculate average prices by brand
-    avg_prices = df.groupby("brand")["new_price"].mean().reset_index()
-    avg_prices.columns = ["Marca", "Preço Médio"]
-    avg_prices = avg_prices.sort_values("Preço Médio", ascending=True).tail(10)
-
     # Create interactive bar chart with Plotly
-    with col1:
-        st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-        fig = px.bar(
-            avg_prices,
-            y="Marca",
-            x="Preço Médio",
-            orientation="h",
-            color="Preço Médio",
-            color_continuous_scale=["#ABEBC6", "#2ecc71", "#196F3D"],
-            title="Top 10 Marcas por Preço Médio",
-            text_auto=".2f",
-        )
-        fig.update_layout(
-            height=400,
-            xaxis_title="Preço Médio (R$)",
-            yaxis_title="",
-            coloraxis_showscale=False,
-            hoverlabel=dict(bgcolor="white", font_size=12),
-            margin=dict(l=0, r=0, t=40, b=0),
+    with col1, st.container(border=True):
+        fig = average_prices_figure(
+            tuple(avg_prices["Marca"].tolist()), tuple(avg_prices["Preço Médio"].tolist())
         )
-        fig.update_traces(
-            texttemplate="R$ %{x:.2f}",
-            textposition="outside",
-            hovertemplate="<b>%{y}</b><br>Preço Médio: R$ %{x:.2f}<extra></extra>",
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.plotly_chart(fig, use_container_width=True, key="average_prices_chart")
 
     # Display data table with styled currency values
-    with col2:
-        st.markdown('<div class="data-table">', unsafe_allow_html=True)
+    with col2, st.container(border=True):
         st.dataframe(
             avg_prices.sort_values("Preço Médio", ascending=False),
             column_config={
@@ -288,60 +438,73 @@ def display_average_prices(df: pd.DataFrame) -> None:
             hide_index=True,
             use_container_width=True,
         )
-        st.markdown("</div>", unsafe_allow_html=True)
 
 
-def display_satisfaction_ratings(df: pd.DataFrame) -> None:
+@st.cache_resource(max_entries=16)
+def satisfaction_figure(labels: tuple[str, ...], values: tuple[float, ...]) -> go.Figure:
+    """
+    Build the bar chart of brands by average review rating.
+
+    Args:
+        labels: Brand names, in plotting order
+        values: Average rating for each brand
+
+    Returns:
+        Plotly figure
+    """
+    fig = go.Figure(
+        go.Bar(
+            x=values,
+            y=labels,
+            orientation="h",
+            marker=dict(
+                color=values,
+                colorscale=[[0, "#F9E79F"], [0.5, "#f39c12"], [1, "#9A7D0A"]],
+                cmin=3.5,
+                cmax=5,
+            ),
+        )
+    )
+    fig.update_layout(
+        title="Top 10 Marcas por Avaliação dos Clientes",
+        height=400,
+        xaxis_title="Avaliação Média (0-5)",
+        xaxis=dict(range=[3, 5]),  # Focus on the range that matters
+        yaxis_title="",
+        hoverlabel=dict(bgcolor="white", font_size=12),
+        margin=dict(l=0, r=0, t=40, b=0),
+    )
+    fig.update_traces(
+        texttemplate="%{x:.1f} ★",
+        textposition="outside",
+        hovertemplate="<b>%{y}</b><br>Avaliação: %{x:.1f} ★<extra></extra>",
+    )
+
+    return fig
+
+
+def display_satisfaction_ratings(satisfaction: pd.DataFrame) -> None:
     """
     Display customer satisfaction ratings by brand with interactive bar chart and data table.
 
     Args:
-        df: DataFrame containing the market research data
+        satisfaction: Top brands by average review rating, sorted ascending
     """
     st.markdown('<div class="subheader">Satisfação por Marca</div>', unsafe_allow_html=True)
 
     # Create column layout with larger space for chart
     col1, col2 = st.columns([3, 1])
 
-    # Calculate average satisfaction ratings by brand
-    satisfaction = df.groupby("brand")["review_rating_number"].mean().reset_index()
-    satisfaction.columns = ["Marca", "Avaliação Média"]
-    satisfaction = satisfaction.sort_values("Avaliação Média", ascending=True).tail(10)
-
     # Create interactive bar chart with Plotly
-    with col1:
-        st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-        fig = px.bar(
-            satisfaction,
-            y="Marca",
-            x="Avaliação Média",
-            orientation="h",
-            color="Avaliação Média",
-            color_continuous_scale=["#F9E79F", "#f39c12", "#9A7D0A"],
-            range_color=[3.5, 5],
-            title="Top 10 Marcas por Avaliação dos Clientes",
-            text_auto=".1f",
-        )
-        fig.update_layout(
-            height=400,
-            xaxis_title="Avaliação Média (0-5)",
-            xaxis=dict(range=[3, 5]),  # Focus on the range that matters
-            yaxis_title="",
-            coloraxis_showscale=False,
-            hoverlabel=dict(bgcolor="white", font_size=12),
-            margin=dict(l=0, r=0, t=40, b=0),
-        )
-        fig.update_traces(
-            texttemplate="%{x:.1f} ★",
-            textposition="outside",
-            hovertemplate="<b>%{y}</b><br>Avaliação: %{x:.1f} ★<extra></extra>",
+    with col1, st.container(border=True):
+        fig = satisfaction_figure(
+            tuple(satisfaction["Marca"].tolist()),
+            tuple(satisfaction["Avaliação Média"].tolist()),
         )
-        st.plotly_chart(fig, use_container_width=True)
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.plotly_chart(fig, use_container_width=True, key="satisfaction_chart")
 
     # Display data table with styled ratings
-    with col2:
-        st.markdown('<div class="data-table">', unsafe_allow_html=True)
+    with col2, st.container(border=True):
         st.dataframe(
             satisfaction.sort_values("Avaliação Média", ascending=False),
             column_config={
@@ -353,18 +516,18 @@ def display_satisfaction_ratings(df: pd.DataFrame) -> None:
             hide_index=True,
             use_container_width=True,
         )
-        st.markdown("</div>", unsafe_allow_html=True)
 
 
-def display_data_filters(df: pd.DataFrame) -> pd.DataFrame:
+def display_data_filters(df: pd.DataFrame, version: float) -> Filters:
     """
     Display filters for the dashboard data.
 
     Args:
         df: Original DataFrame containing the market research data
+        version: Data file version from ``data_version``
 
     Returns:
-        Filtered DataFrame based on user selections
+        Filter state based on user selections
     """
     st.sidebar.markdown("## Filtros")
 
@@ -374,8 +537,7 @@ def display_data_filters(df: pd.DataFrame) -> pd.DataFrame:
     )
 
     # Price range filter
-    min_price = float(df["new_price"].min())
-    max_price = float(df["new_price"].max())
+    min_price, max_price = price_bounds(version)
     price_range = st.sidebar.slider(
         "Faixa de Preço (R$):",
         min_value=min_price,
@@ -389,22 +551,7 @@ def display_data_filters(df: pd.DataFrame) -> pd.DataFrame:
         "Avaliação Mínima:", min_value=0.0, max_value=5.0, value=0.0, step=0.5, format="%.1f ★"
     )
 
-    # Apply filters
-    filtered_df = df.copy()
-
-    if selected_brands:
-        filtered_df = filtered_df[filtered_df["brand"].isin(selected_brands)]
-
-    filtered_df = filtered_df[
-        (filtered_df["new_price"] >= price_range[0])
-        & (filtered_df["new_price"] <= price_range[1])
-        & (filtered_df["review_rating_number"] >= rating_range)
-    ]
-
-    # Display number of filtered items
-    st.sidebar.markdown(f"**{len(filtered_df)} produtos** correspondem aos filtros.")
-
-    return filtered_df
+    return tuple(selected_brands), tuple(price_range), rating_range
 
 
 def main():
@@ -446,17 +593,26 @@ def main():
 
     try:
         # Load data
-        df = load_data(DATABASE_PATH, QUERY)
+        try:
+            version = data_version(DATA_PATH)
+            df = load_data(str(DATA_PATH), COLUMNS, version)
+        except OSError as e:
+            st.error(f"Erro ao acessar o arquivo de dados: {e}")
+            return
 
         # Check if data was loaded successfully
         if df.empty:
             st.warning(
-                "⚠️ Não foi possível carregar os dados. Verifique o caminho do banco de dados."
+                "⚠️ Não foi possível carregar os dados. Verifique o caminho do arquivo de dados."
             )
             return
 
         # Apply data filters
-        filtered_df = display_data_filters(df)
+        filters = display_data_filters(df, version)
+        filtered_df = filter_data(df, *filters)
+
+        # Display number of filtered items
+        st.sidebar.markdown(f"**{len(filtered_df)} produtos** correspondem aos filtros.")
 
         # Add filter indicator
         if len(filtered_df) < len(df):
@@ -466,9 +622,10 @@ def main():
 
         # Display all dashboard components with filtered data
         display_kpi_metrics(filtered_df)
-        display_top_brands(filtered_df)
-        display_average_prices(filtered_df)
-        display_satisfaction_ratings(filtered_df)
+        top_brands_data, avg_prices, satisfaction = brand_aggregations(version, *filters)
+        display_top_brands(top_brands_data)
+        display_average_prices(avg_prices)
+        display_satisfaction_ratings(satisfaction)
 
         # Add footer
         st.markdown("---")
@@ -5,27 +5,83 @@ MercadoLivre Scraper
 
 This spider crawls MercadoLivre product listings for frost-free refrigerators,
 extracting product details such as brand, name, pricing, and review information.
-The spider is limited to crawl a maximum of 20 pages by default.
+The spider is limited to crawl a maximum of 20 pages by default, which are
+requested concurrently.
 
 Usage:
     scrapy crawl mercadolivre -o ../data/data.json
 """
 
+import re
+
 import scrapy
+from parsel.csstranslator import css2xpath
+
+PRODUCT_SELECTOR = "div.ui-search-result__wrapper"
+NEXT_PAGE_SELECTOR = "li.andes-pagination__button.andes-pagination__button--next a::attr(href)"
+
+# Brazilian price format ("1.234,56"): drop thousands separators, use a dot for decimals
+PRICE_TRANSLATION = str.maketrans({".": "", ",": "."})
+
+# CSS selectors for each field: current ("poly") layout first, legacy ("ui-search") second
+FIELD_SELECTORS = {
+    "brand": (
+        "span.poly-component__brand::text",
+        "span.ui-search-item__brand-discoverability.ui-search-item__group__element::text",
+    ),
+    "name": (
+        "h3.poly-component__title-wrapper a::text",
+        "h2.ui-search-item__title.ui-search-item__group__element a::text",
+    ),
+    "old_price": (
+        "s.andes-money-amount.andes-money-amount--previous.andes-money-amount--cents-comma"
+        " span.andes-money-amount__fraction::text",
+        "s.andes-money-amount span.andes-money-amount__fraction::text",
+    ),
+    "new_price": (
+        "div.poly-price__current span.andes-money-amount__fraction::text",
+        "div.ui-search-price__second-line span.andes-money-amount__fraction::text",
+    ),
+    "review_rating_number": (
+        "span.poly-reviews__rating::text",
+        "span.ui-search-reviews__rating-number::text",
+    ),
+    "review_amount": (
+        "span.poly-reviews__total::text",
+        "span.ui-search-reviews__amount::text",
+    ),
+}
+
+
+def parse_price(value):
+    """
+    Convert a scraped Brazilian-formatted price string to a float.
+
+    Args:
+        value (str | None): Price text such as "1.234" or "1.234,56"
+
+    Returns:
+        float | None: Parsed price, or None when the price is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return float(value.translate(PRICE_TRANSLATION))
+    except ValueError:
+        return None
 
 
 class MercadolivreSpider(scrapy.Spider):
     """
     Scrapy spider to scrape product data from Mercado Livre's frost-free refrigerator listings.
 
-    This spider navigates through multiple pages of product listings and extracts details
-    such as brand, name, prices, review ratings, and review counts.
+    This spider requests all listing pages at once, so they are downloaded concurrently,
+    and extracts details such as brand, name, prices, review ratings, and review counts.
 
     Attributes:
         name (str): Spider identifier used by Scrapy
         allowed_domains (list): Restricts crawling to specified domains
         start_urls (list): Initial URL(s) to begin crawling
-        page_count (int): Counter for tracking current page number
         max_pages (int): Maximum number of pages to crawl
     """
 
@@ -34,95 +90,115 @@ class MercadolivreSpider(scrapy.Spider):
     start_urls = ["https://lista.mercadolivre.com.br/geladeira-frost-free"]
 
     # Pagination control
-    page_count = 1
     max_pages = 20
 
+    # CSS selectors translated to XPath once, instead of once per product
+    _product_xpath = css2xpath(PRODUCT_SELECTOR)
+    _field_xpaths = {
+        field: tuple(css2xpath(selector) for selector in selectors)
+        for field, selectors in FIELD_SELECTORS.items()
+    }
+
     def parse(self, response):
         """
-        Parse product information from MercadoLivre search results page.
+        Parse the first results page and schedule every remaining page at once.
+
+        The pagination URLs follow the pattern ``..._Desde_<offset>``; the page size is
+        inferred from the offset of the "next page" link and used to build the URLs of
+        all pages up to ``max_pages``.
 
         Args:
             response (scrapy.http.Response): HTTP response from the website
 
         Yields:
             dict: Product information including brand, name, pricing, and reviews
-            scrapy.Request: Request to the next page if available and within limits
+            scrapy.Request: Requests for the remaining pages within limits
         """
-        # Select all product containers on the page
-        products = response.css("div.ui-search-result__wrapper")
+        yield from self.parse_page(response)
+
+        next_page = response.css(NEXT_PAGE_SELECTOR).get()
+        if next_page is None:
+            return
+
+        match = re.search(r"_Desde_(\d+)", next_page)
+        if match is None:
+            # Unknown pagination format, fall back to following the links one by one
+            yield response.follow(next_page, callback=self.parse_next_pages, cb_kwargs={"page": 2})
+            return
+
+        page_size = int(match.group(1)) - 1
+        prefix, suffix = next_page[: match.start()], next_page[match.end() :]
+        for page in range(1, self.max_pages):
+            yield response.follow(
+                f"{prefix}_Desde_{page_size * page + 1}{suffix}", callback=self.parse_page
+            )
+
+    def parse_next_pages(self, response, page):
+        """
+        Parse a results page and follow its "next page" link, up to ``max_pages``.
 
-        # Extract data for each product
-        for product in products:
-            yield {
-                "brand": product.css("span.poly-component__brand::text").get(),
-                "name": product.css("h3.poly-component__title-wrapper a::text").get(),
-                "old_price": product.css(
-                    "s.andes-money-amount.andes-money-amount--previous.andes-money-amount--cents-comma span.andes-money-amount__fraction::text"
-                ).get(),
-                "new_price": product.css(
-                    "div.poly-price__current span.andes-money-amount__fraction::text"
-                ).get(),
-                "review_rating_number": product.css("span.poly-reviews__rating::text").get(),
-                "review_amount": (
-                    product.css("span.poly-reviews__total::text").get(default="0") or "0"
-                ).strip("()"),  # Ensures `None` does not cause an error
-            }
+        Used when the page URLs cannot be inferred, so pages are fetched sequentially.
+
+        Args:
+            response (scrapy.http.Response): HTTP response from the website
+            page (int): Number of the current page
+
+        Yields:
+            dict: Product information including brand, name, pricing, and reviews
+            scrapy.Request: Request to the next page if available and within limits
+        """
+        yield from self.parse_page(response)
 
         # Check if the maximum number of pages has been reached
-        if self.page_count < self.max_pages:
-            next_page = response.css(
-                "li.andes-pagination__button.andes-pagination__button--next a::attr(href)"
-            ).get()
-            # Extract the URL for the next page
+        if page < self.max_pages:
+            next_page = response.css(NEXT_PAGE_SELECTOR).get()
             if next_page is not None:
-                self.page_count += 1
-                # Follow the next page and recursively call the parse method
-                yield response.follow(next_page, callback=self.parse_next_pages)
+                yield response.follow(
+                    next_page, callback=self.parse_next_pages, cb_kwargs={"page": page + 1}
+                )
 
-    def parse_next_pages(self, response):
+    def parse_page(self, response):
         """
         Parse product information from MercadoLivre search results page.
 
+        Handles both the current ("poly") and the legacy ("ui-search") product card
+        layouts by falling back to the legacy selectors.
+
         Args:
             response (scrapy.http.Response): HTTP response from the website
 
         Yields:
             dict: Product information including brand, name, pricing, and reviews
-            scrapy.Request: Request to the next page if available and within limits
         """
         # Select all product containers on the page
-        products = response.css("div.ui-search-result__wrapper")
+        products = response.xpath(self._product_xpath)
 
         # Extract data for each product
         for product in products:
+            # Ensures `None` does not cause an error
+            review_amount = self._extract(product, "review_amount") or "0"
             yield {
-                "brand": product.css(
-                    "span.ui-search-item__brand-discoverability.ui-search-item__group__element::text"
-                ).get(),
-                "name": product.css(
-                    "h2.ui-search-item__title.ui-search-item__group__element a::text"
-                ).get(),
-                "old_price": product.css(
-                    "s.andes-money-amount span.andes-money-amount__fraction::text"
-                ).get(),
-                "new_price": product.css(
-                    "div.ui-search-price__second-line span.andes-money-amount__fraction::text"
-                ).get(),
-                "review_rating_number": product.css(
-                    "span.ui-search-reviews__rating-number::text"
-                ).get(),
-                "review_amount": (
-                    product.css("span.ui-search-reviews__amount::text").get(default="0") or "0"
-                ).strip("()"),  # Ensures `None` does not cause an error
+                "brand": self._extract(product, "brand"),
+                "name": self._extract(product, "name"),
+                "old_price": parse_price(self._extract(product, "old_price")),
+                "new_price": parse_price(self._extract(product, "new_price")),
+                "review_rating_number": self._extract(product, "review_rating_number"),
+                "review_amount": review_amount.strip("()"),
             }
 
-        # Check if the maximum number of pages has been reached
-        if self.page_count < self.max_pages:
-            next_page = response.css(
-                "li.andes-pagination__button.andes-pagination__button--next a::attr(href)"
-            ).get()
-            # Extract the URL for the next page
-            if next_page is not None:
-                self.page_count += 1
-                # Follow the next page and recursively call the parse method
-                yield response.follow(next_page, callback=self.parse_next_pages)
+    def _extract(self, product, field):
+        """
+        Extract a field from a product card, trying each layout's selector in turn.
+
+        Args:
+            product (parsel.Selector): Product container selector
+            field (str): Key of the field in ``FIELD_SELECTORS``
+
+        Returns:
+            str | None: First non-empty value found, or None
+        """
+        for xpath in self._field_xpaths[field]:
+            value = product.xpath(xpath).get()
+            if value:
+                return value
+        return None
@@ -2,7 +2,7 @@
 Mercado Livre Data Processor
 
 This script processes product data from Mercado Livre, performs data type conversions,
-and stores the processed data in an SQLite database.
+and stores the processed data in an SQLite database and a Parquet file.
 
 Usage:
     python process_mercadolivre_data.py
@@ -11,7 +11,9 @@ Usage:
 import sqlite3
 from datetime import datetime
 
+import orjson
 import pandas as pd
+import pyarrow as pa
 
 
 def load_data(file_path: str) -> pd.DataFrame:
@@ -24,8 +26,12 @@ def load_data(file_path: str) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Raw DataFrame loaded from the JSON file.
     """
-    # Load JSON data into a DataFrame
-    df = pd.read_json(file_path)
+    # Scrapy's feed export writes a JSON array, so parse it with orjson and build
+    # the columns directly in Arrow
+    with open(file_path, "rb") as f:
+        records = orjson.loads(f.read())
+
+    df = pa.Table.from_pylist(records).to_pandas()
     return df
 
 
@@ -39,6 +45,14 @@ def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Preprocessed DataFrame.
     """
+    # Prices are parsed to floats by the spider; string prices come from an older
+    # scrape and would be misread (e.g. "3.499" as 3.499 instead of 3499)
+    for col in ["new_price", "old_price"]:
+        if not pd.api.types.is_numeric_dtype(df[col]) and df[col].notna().any():
+            raise ValueError(
+                f"Column '{col}' is not numeric; run the spider again to regenerate the data"
+            )
+
     # Remove rows where brand is nan
     df = df.dropna(subset=["brand"]).reset_index(drop=True)
 
@@ -46,17 +60,15 @@ def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
     df["source"] = "https://lista.mercadolivre.com.br/geladeira-frost-free"
     df["crawled_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    # Convert price columns from string to float
-    # Replace commas with dots for proper decimal formatting
-    price_columns = ["new_price", "old_price"]
-    for col in price_columns:
-        df[col] = df[col].astype(str).str.replace(".", "", regex=False)
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-
     # Convert review columns to appropriate types
     df["review_rating_number"] = pd.to_numeric(df["review_rating_number"], errors="coerce")
     df["review_amount"] = pd.to_numeric(df["review_amount"], errors="coerce").astype("Int64")
 
+    # Capitalize brand names properly, calling title() once per unique brand,
+    # and store them as a categorical
+    mapping = {brand: brand.title() for brand in pd.unique(df["brand"])}
+    df["brand"] = df["brand"].map(mapping).astype("category")
+
     return df
 
 
@@ -71,8 +83,33 @@ def save_to_database(df: pd.DataFrame, db_path: str, table_name: str) -> None:
     """
     # Connect to the SQLite database
     with sqlite3.connect(db_path) as conn:
-        # Save the DataFrame to the database
-        df.to_sql(table_name, conn, if_exists="replace", index=False)
+        # Use WAL with relaxed syncs and a larger in-memory cache for the bulk write
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+        # Save the DataFrame to the database using multi-row INSERTs
+        df.to_sql(
+            table_name, conn, if_exists="replace", index=False, method="multi", chunksize=1000
+        )
+
+
+def save_to_parquet(df: pd.DataFrame, parquet_path: str) -> None:
+    """
+    Save a DataFrame to a Snappy-compressed Parquet file.
+
+    Prices and ratings are downcast to float32 for the dashboard copy only; the
+    SQLite table keeps the full float64 values.
+
+    Args:
+        df (pd.DataFrame): DataFrame to save.
+        parquet_path (str): Path to the Parquet file.
+    """
+    df = df.astype(
+        {"new_price": "float32", "old_price": "float32", "review_rating_number": "float32"}
+    )
+    df.to_parquet(parquet_path, engine="pyarrow", compression="snappy", index=False)
 
 
 def main() -> None:
@@ -82,6 +119,7 @@ def main() -> None:
     # Define file paths and table name
     data_file_path = "../../data/data.json"
     db_file_path = "../../data/data.db"
+    parquet_file_path = "../../data/data.parquet"
     table_name = "mercadolivre"
 
     # Load the data
@@ -93,6 +131,9 @@ def main() -> None:
     # Save the preprocessed data to the database
     save_to_database(df, db_file_path, table_name)
 
+    # Save a columnar copy for the dashboard
+    save_to_parquet(df, parquet_file_path)
+
 
 if __name__ == "__main__":
     main()
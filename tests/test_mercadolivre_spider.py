@@ -0,0 +1,71 @@
+import pytest
+import scrapy
+from scrapy.http import HtmlResponse
+
+from mercadolivre_scrapy.extract.spiders.mercadolivre import MercadolivreSpider, parse_price
+
+START_URL = "https://lista.mercadolivre.com.br/geladeira-frost-free"
+
+
+def make_listing_response(next_page: str) -> HtmlResponse:
+    body = f"""
+    <html><body>
+      <ul>
+        <li class="andes-pagination__button andes-pagination__button--next">
+          <a href="{next_page}">Seguinte</a>
+        </li>
+      </ul>
+    </body></html>
+    """
+    return HtmlResponse(url=START_URL, body=body, encoding="utf-8")
+
+
+def test_parse_schedules_all_pages_from_offset():
+    spider = MercadolivreSpider()
+    response = make_listing_response(f"{START_URL}_Desde_49_NoIndex_True")
+
+    requests = [r for r in spider.parse(response) if isinstance(r, scrapy.Request)]
+
+    assert len(requests) == spider.max_pages - 1
+    assert requests[0].url == f"{START_URL}_Desde_49_NoIndex_True"
+    assert requests[-1].url == f"{START_URL}_Desde_913_NoIndex_True"
+    assert all(r.callback == spider.parse_page for r in requests)
+
+
+def test_parse_follows_next_page_chain_without_offset():
+    spider = MercadolivreSpider()
+    response = make_listing_response(f"{START_URL}?page=2")
+
+    requests = [r for r in spider.parse(response) if isinstance(r, scrapy.Request)]
+
+    assert [r.url for r in requests] == [f"{START_URL}?page=2"]
+    assert requests[0].callback == spider.parse_next_pages
+    assert requests[0].cb_kwargs == {"page": 2}
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("1.234", 1234.0),
+        ("1.234,56", 1234.56),
+        ("899", 899.0),
+        ("", None),
+        (None, None),
+        ("abc", None),
+    ],
+)
+def test_parse_price(value, expected):
+    assert parse_price(value) == expected
+
+
+def test_parse_next_pages_stops_at_max_pages():
+    spider = MercadolivreSpider()
+    response = make_listing_response(f"{START_URL}?page=21")
+
+    requests = [
+        r
+        for r in spider.parse_next_pages(response, page=spider.max_pages)
+        if isinstance(r, scrapy.Request)
+    ]
+
+    assert requests == []
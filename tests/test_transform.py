@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+
+from mercadolivre_scrapy.transform.main import preprocess_data
+
+
+def make_raw_data(**overrides) -> pd.DataFrame:
+    data = {
+        "brand": ["lg", "LG", None],
+        "name": ["Geladeira A", "Geladeira B", "Geladeira C"],
+        "old_price": [None, 4999.0, None],
+        "new_price": [3499.0, 1234.56, 2000.0],
+        "review_rating_number": ["4.8", None, "4.5"],
+        "review_amount": ["10", "0", "3"],
+    }
+    data.update(overrides)
+    return pd.DataFrame(data)
+
+
+def test_preprocess_data_keeps_float64_prices():
+    df = preprocess_data(make_raw_data())
+
+    assert df["brand"].tolist() == ["Lg", "Lg"]
+    assert df["new_price"].tolist() == [3499.0, 1234.56]
+    assert df["new_price"].dtype == "float64"
+    assert df["review_rating_number"].tolist()[:1] == [4.8]
+
+
+def test_preprocess_data_rejects_string_prices():
+    raw = make_raw_data(new_price=["3.499", "1.234", "2.000"])
+
+    with pytest.raises(ValueError, match="new_price"):
+        preprocess_data(raw)